@@ -1,10 +1,14 @@
 from fastapi import Depends
+from app.core.config import get_settings
 from app.repositories.lead_repository import LeadRepository
 from app.services.lead_service import LeadService
+from app.utils.concurrency import AdmissionController, SingleFlight
 
 
 # Singleton instances for in-memory storage
 _lead_repository = None
+_single_flight = None
+_admission_controller = None
 
 
 def get_lead_repository() -> LeadRepository:
@@ -15,8 +19,32 @@ def get_lead_repository() -> LeadRepository:
     return _lead_repository
 
 
+def get_single_flight() -> SingleFlight:
+    """Dependency injection for query coalescing."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+def get_admission_controller() -> AdmissionController:
+    """Dependency injection for the heavy query worker pool."""
+    global _admission_controller
+    if _admission_controller is None:
+        settings = get_settings()
+        _admission_controller = AdmissionController(
+            max_workers=settings.QUERY_WORKERS,
+            max_pending=settings.QUERY_MAX_PENDING,
+            latency_budget=settings.QUERY_LATENCY_BUDGET_SECONDS,
+            retry_after=settings.QUERY_RETRY_AFTER_SECONDS,
+        )
+    return _admission_controller
+
+
 def get_lead_service(
-    lead_repository: LeadRepository = Depends(get_lead_repository)
+    lead_repository: LeadRepository = Depends(get_lead_repository),
+    single_flight: SingleFlight = Depends(get_single_flight),
+    admission_controller: AdmissionController = Depends(get_admission_controller),
 ) -> LeadService:
     """Dependency injection for lead service."""
-    return LeadService(lead_repository)
+    return LeadService(lead_repository, single_flight, admission_controller)
@@ -1,9 +1,12 @@
+from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, status
 from app.api.v1.dependencies import get_lead_service
 from app.core.config import Settings, get_settings
 from app.models.schemas import (
     LeadBulkCreate,
+    LeadChangeListResponse,
+    LeadChangeResponse,
     LeadCreate,
     LeadListResponse,
     LeadResponse,
@@ -93,6 +96,55 @@ async def list_leads(
     )
 
 
+@router.get(
+    "/changes",
+    response_model=LeadChangeListResponse,
+    summary="List lead changes since a watermark",
+)
+async def list_lead_changes(
+    updated_since: Optional[datetime] = Query(
+        None, description="Only return changes at or after this timestamp"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous sync"),
+    page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
+    lead_service: LeadService = Depends(get_lead_service),
+    settings: Settings = Depends(get_settings),
+):
+    """
+    Incremental change feed for downstream sync.
+    
+    Returns leads created, updated or deleted after the watermark, ordered
+    by `(updated_at, id)`. Deleted leads are returned as tombstones with
+    `deleted: true` and no `lead` payload. `total` counts the changes
+    remaining after the watermark.
+    
+    **Sync:**
+    - Start with no parameters (full snapshot) or with `updated_since`
+    - Follow `next_cursor` while `has_next` is true
+    - Store the last `next_cursor` (never null) and pass it as `cursor`
+      on the next sync
+    """
+    page_size = min(page_size, settings.MAX_PAGE_SIZE)
+    
+    result = await lead_service.list_changes(
+        page_size=page_size,
+        cursor=cursor,
+        updated_since=updated_since,
+    )
+    
+    return LeadChangeListResponse(
+        data=[LeadChangeResponse(**change.to_dict()) for change in result.data],
+        pagination=PaginationMetadata(
+            total=result.total,
+            page_size=result.page_size,
+            next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
+            has_next=result.has_next,
+            has_prev=result.has_prev,
+        ),
+    )
+
+
 @router.get(
     "/{lead_id}",
     response_model=LeadResponse,
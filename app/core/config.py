@@ -28,6 +28,12 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
     
+    # Admission control for heavy list queries
+    QUERY_WORKERS: int = 2
+    QUERY_MAX_PENDING: int = 16
+    QUERY_LATENCY_BUDGET_SECONDS: float = 1.0
+    QUERY_RETRY_AFTER_SECONDS: int = 1
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
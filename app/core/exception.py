@@ -27,3 +27,15 @@ class ValidationException(AppException):
     
     def __init__(self, message: str, details: Any = None):
         super().__init__(message=message, status_code=422, details=details)
+
+
+class ServiceOverloadedException(AppException):
+    """Service overloaded exception - request was shed."""
+    
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            message="Service is overloaded, please retry later",
+            status_code=503,
+            details={"retry_after": retry_after}
+        )
+        self.retry_after = retry_after
@@ -1,9 +1,11 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.api.v1.routes import leads
 from app.core.config import get_settings
-from app.api.v1.dependencies import get_lead_repository
+from app.core.exception import AppException, ServiceOverloadedException
+from app.api.v1.dependencies import get_admission_controller, get_lead_repository
 from app.utils.seed_data import SeedDataGenerator
 
 
@@ -23,6 +25,7 @@ async def lifespan(app: FastAPI):
     yield
     
     # Cleanup (if needed)
+    get_admission_controller().shutdown()
     print("🔌 Shutting down...")
 
 
@@ -46,6 +49,27 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(AppException)
+async def app_exception_handler(request: Request, exc: AppException):
+    """Render application exceptions with their HTTP status code."""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.message, "details": exc.details},
+    )
+
+
+@app.exception_handler(ServiceOverloadedException)
+async def service_overloaded_handler(
+    request: Request, exc: ServiceOverloadedException
+):
+    """Shed load with 503 and a Retry-After hint."""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.message},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 # Root endpoint
 @app.get("/", tags=["root"])
 async def root():
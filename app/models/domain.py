@@ -44,3 +44,31 @@ class Lead:
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+class LeadChange:
+    """Change feed entry - an upsert or a deletion of a lead."""
+    
+    def __init__(
+        self,
+        lead_id: str,
+        changed_at: datetime,
+        lead: Optional[Lead] = None,
+    ):
+        self.lead_id = lead_id
+        self.changed_at = changed_at
+        self.lead = lead
+    
+    @property
+    def deleted(self) -> bool:
+        """Whether this change is a tombstone for a deleted lead."""
+        return self.lead is None
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "id": self.lead_id,
+            "changed_at": self.changed_at.isoformat(),
+            "deleted": self.deleted,
+            "lead": self.lead.to_dict() if self.lead else None,
+        }
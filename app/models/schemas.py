@@ -40,6 +40,20 @@ class LeadListResponse(BaseModel):
     pagination: "PaginationMetadata"
 
 
+class LeadChangeResponse(BaseModel):
+    """Schema for a change feed entry."""
+    id: str
+    changed_at: datetime
+    deleted: bool
+    lead: Optional[LeadResponse] = None
+
+
+class LeadChangeListResponse(BaseModel):
+    """Schema for paginated change feed response."""
+    data: list[LeadChangeResponse]
+    pagination: "PaginationMetadata"
+
+
 class PaginationMetadata(BaseModel):
     """Pagination metadata."""
     total: int
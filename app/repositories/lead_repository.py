@@ -1,8 +1,10 @@
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
 from typing import Optional
-from app.models.domain import Lead
+from app.core.exception import ValidationException
+from app.models.domain import Lead, LeadChange
 from app.repositories.base import BaseRepository
-from app.utils.pagination import CursorPage, decode_cursor
+from app.utils.pagination import CursorPage, create_change_cursor, decode_cursor
 
 
 class LeadRepository(BaseRepository[Lead]):
@@ -10,16 +12,22 @@ class LeadRepository(BaseRepository[Lead]):
     
     def __init__(self):
         self._storage: dict[str, Lead] = {}
+        # Change index: one (changed_at, id) entry per lead, sorted ascending.
+        # Deleted leads keep their entry (as a tombstone) at the deletion time.
+        self._change_index: list[tuple[datetime, str]] = []
+        self._change_keys: dict[str, tuple[datetime, str]] = {}
     
     async def create(self, lead: Lead) -> Lead:
         """Create a new lead."""
         self._storage[lead.id] = lead
+        self._record_change(lead.id, lead.updated_at)
         return lead
     
     async def bulk_create(self, leads: list[Lead]) -> list[Lead]:
         """Bulk create leads."""
         for lead in leads:
             self._storage[lead.id] = lead
+            self._record_change(lead.id, lead.updated_at)
         return leads
     
     async def get_by_id(self, lead_id: str) -> Optional[Lead]:
@@ -30,12 +38,14 @@ class LeadRepository(BaseRepository[Lead]):
         """Update a lead."""
         lead.updated_at = datetime.utcnow()
         self._storage[lead.id] = lead
+        self._record_change(lead.id, lead.updated_at)
         return lead
     
     async def delete(self, lead_id: str) -> bool:
-        """Delete a lead."""
+        """Delete a lead, leaving a tombstone in the change index."""
         if lead_id in self._storage:
             del self._storage[lead_id]
+            self._record_change(lead_id, datetime.utcnow())
             return True
         return False
     
@@ -48,6 +58,30 @@ class LeadRepository(BaseRepository[Lead]):
         max_headcount: Optional[int] = None,
     ) -> CursorPage[Lead]:
         """Find all leads with cursor-based pagination and filters."""
+        return self.find_all_paginated_sync(
+            page_size=page_size,
+            cursor=cursor,
+            industry=industry,
+            min_headcount=min_headcount,
+            max_headcount=max_headcount,
+        )
+    
+    def find_all_paginated_sync(
+        self,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        industry: Optional[list[str]] = None,
+        min_headcount: Optional[int] = None,
+        max_headcount: Optional[int] = None,
+    ) -> CursorPage[Lead]:
+        """
+        Blocking variant of find_all_paginated.
+        
+        CPU-bound - meant to run in a worker thread. Copying the storage
+        values into a list is atomic under the GIL, so concurrent creates
+        and deletes cannot break iteration. The Lead objects themselves are
+        shared, so a concurrent update may be seen mid-query.
+        """
         
         # Apply filters
         filtered_leads = list(self._storage.values())
@@ -119,6 +153,101 @@ class LeadRepository(BaseRepository[Lead]):
             has_prev=has_prev,
         )
     
+    async def find_changes_since(
+        self,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> CursorPage[LeadChange]:
+        """
+        Find leads changed after a watermark, ordered by (updated_at, id).
+        
+        Only the index range after the watermark is scanned, so the cost
+        is proportional to the delta rather than the whole dataset. Changes
+        made exactly at updated_since are included.
+        """
+        
+        # Resolve the watermark - cursor takes precedence over updated_since.
+        # An empty id sorts before every real id, so ties are included.
+        if cursor:
+            watermark = self._parse_change_cursor(cursor)
+        elif updated_since is not None:
+            watermark = (updated_since, "")
+        else:
+            watermark = (datetime.min, "")
+        
+        start_index = bisect_right(self._change_index, watermark)
+        
+        # Number of changes remaining after the watermark
+        total = len(self._change_index) - start_index
+        
+        # Slice data
+        end_index = start_index + page_size
+        page_keys = self._change_index[start_index:end_index]
+        page_data = [
+            LeadChange(
+                lead_id=lead_id,
+                changed_at=changed_at,
+                lead=self._storage.get(lead_id),
+            )
+            for changed_at, lead_id in page_keys
+        ]
+        
+        has_next = end_index < len(self._change_index)
+        
+        # Always hand back a position to resume from - the last change, or
+        # the watermark itself once the sync has caught up
+        if page_data:
+            last_change = page_data[-1]
+            resume_at = (last_change.changed_at, last_change.lead_id)
+        else:
+            resume_at = watermark
+        next_cursor = create_change_cursor(resume_at[0].isoformat(), resume_at[1])
+        
+        return CursorPage(
+            data=page_data,
+            total=total,
+            page_size=page_size,
+            next_cursor=next_cursor,
+            prev_cursor=None,
+            has_next=has_next,
+            has_prev=start_index > 0,
+        )
+    
+    def _parse_change_cursor(self, cursor: str) -> tuple[datetime, str]:
+        """Parse a change feed cursor into an (updated_at, id) watermark."""
+        cursor_data = decode_cursor(cursor)
+        if not isinstance(cursor_data, dict):
+            cursor_data = {}
+        
+        cursor_updated_at = cursor_data.get("updated_at")
+        cursor_id = cursor_data.get("id")
+        if not isinstance(cursor_updated_at, str) or not isinstance(cursor_id, str):
+            raise ValidationException("Invalid cursor", details={"cursor": cursor})
+        
+        try:
+            watermark_at = datetime.fromisoformat(cursor_updated_at)
+        except ValueError:
+            raise ValidationException("Invalid cursor", details={"cursor": cursor})
+        
+        # Stored timestamps are naive UTC, so aware ones cannot be compared
+        if watermark_at.tzinfo is not None:
+            raise ValidationException("Invalid cursor", details={"cursor": cursor})
+        
+        return watermark_at, cursor_id
+    
+    def _record_change(self, lead_id: str, changed_at: datetime) -> None:
+        """Move a lead's entry in the change index to its latest change time."""
+        old_key = self._change_keys.get(lead_id)
+        if old_key is not None:
+            idx = bisect_left(self._change_index, old_key)
+            if idx < len(self._change_index) and self._change_index[idx] == old_key:
+                del self._change_index[idx]
+        
+        new_key = (changed_at, lead_id)
+        insort(self._change_index, new_key)
+        self._change_keys[lead_id] = new_key
+    
     def _create_cursor(self, lead: Lead) -> str:
         """Create cursor from lead."""
         from app.utils.pagination import create_cursor
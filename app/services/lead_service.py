@@ -1,8 +1,10 @@
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from app.core.exception import LeadNotFoundException
-from app.models.domain import Lead
+from app.models.domain import Lead, LeadChange
 from app.models.schemas import LeadCreate
 from app.repositories.lead_repository import LeadRepository
+from app.utils.concurrency import AdmissionController, SingleFlight
 from app.utils.pagination import CursorPage
 
 
@@ -12,8 +14,12 @@ class LeadService:
     def __init__(
         self, 
         lead_repository: LeadRepository,
+        single_flight: Optional[SingleFlight] = None,
+        admission_controller: Optional[AdmissionController] = None,
     ):
         self.lead_repo = lead_repository
+        self.single_flight = single_flight
+        self.admission_controller = admission_controller
     
     async def create_lead(self, lead_data: LeadCreate) -> Lead:
         """Create a new lead."""
@@ -59,11 +65,60 @@ class LeadService:
         min_headcount: Optional[int] = None,
         max_headcount: Optional[int] = None,
     ) -> CursorPage[Lead]:
-        """List leads with pagination and filters."""
-        return await self.lead_repo.find_all_paginated(
+        """
+        List leads with pagination and filters.
+        
+        Identical concurrent queries share one computation, which runs in
+        the admission-controlled worker pool when one is configured.
+        """
+        query = dict(
             page_size=page_size,
             cursor=cursor,
             industry=industry,
             min_headcount=min_headcount,
             max_headcount=max_headcount,
-        )
\ No newline at end of file
+        )
+        
+        async def run_query() -> CursorPage[Lead]:
+            if self.admission_controller is None:
+                return await self.lead_repo.find_all_paginated(**query)
+            return await self.admission_controller.run(
+                self.lead_repo.find_all_paginated_sync, **query
+            )
+        
+        if self.single_flight is None:
+            return await run_query()
+        
+        key = (
+            "list_leads",
+            page_size,
+            cursor,
+            tuple(sorted(set(industry))) if industry else None,
+            min_headcount,
+            max_headcount,
+        )
+        return await self.single_flight.do(key, run_query)
+    
+    async def list_changes(
+        self,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> CursorPage[LeadChange]:
+        """List leads created, updated or deleted after a watermark."""
+        # Stored timestamps are naive UTC - normalize aware watermarks to match
+        if updated_since is not None and updated_since.tzinfo is not None:
+            try:
+                updated_since = updated_since.astimezone(timezone.utc).replace(
+                    tzinfo=None
+                )
+            except OverflowError:
+                # Shifted past the datetime range - clamp to the nearest bound
+                ahead_of_utc = updated_since.utcoffset() > timedelta(0)
+                updated_since = datetime.min if ahead_of_utc else datetime.max
+        
+        return await self.lead_repo.find_changes_since(
+            page_size=page_size,
+            cursor=cursor,
+            updated_since=updated_since,
+        )
@@ -0,0 +1,309 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+import httpx
+import pytest
+from app.api.v1.dependencies import (
+    get_admission_controller,
+    get_lead_repository,
+    get_single_flight,
+)
+from app.core.exception import ServiceOverloadedException
+from app.main import app
+from app.models.domain import Lead
+from app.repositories.lead_repository import LeadRepository
+from app.services.lead_service import LeadService
+from app.utils.concurrency import AdmissionController, SingleFlight
+from app.utils.seed_data import SeedDataGenerator
+
+BASE_TIME = datetime(2024, 1, 1)
+LOAD_TEST_LEADS = 100_000
+LOAD_TEST_QUERIES = 60
+
+
+class SlowLeadRepository(LeadRepository):
+    """
+    Lead repository whose list query blocks and counts its calls.
+
+    time.sleep releases the GIL, so this models a slow query, not CPU
+    contention with the event loop.
+    """
+
+    def __init__(self, delay: float = 0.1):
+        super().__init__()
+        self.delay = delay
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+
+    def find_all_paginated_sync(self, **kwargs):
+        with self._calls_lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return super().find_all_paginated_sync(**kwargs)
+
+
+@pytest.fixture
+def controller():
+    controller = AdmissionController(
+        max_workers=1, max_pending=2, latency_budget=5.0, retry_after=7
+    )
+    yield controller
+    controller.shutdown()
+
+
+@pytest.fixture
+def overload_client():
+    """ASGI client whose list queries are slow and heavily admission-limited."""
+    repo = SlowLeadRepository(delay=0.3)
+    lead = Lead(
+        id="lead-1",
+        name="John Doe",
+        job_title="CEO",
+        company="Acme Corp",
+        email="john.doe@acme.com",
+        industry="Technology",
+    )
+    asyncio.run(repo.create(lead))
+    controller = AdmissionController(
+        max_workers=1, max_pending=2, latency_budget=5.0, retry_after=7
+    )
+    app.dependency_overrides[get_lead_repository] = lambda: repo
+    app.dependency_overrides[get_single_flight] = SingleFlight
+    app.dependency_overrides[get_admission_controller] = lambda: controller
+    yield httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+    app.dependency_overrides.clear()
+    controller.shutdown()
+
+
+def blocking_until(gate: threading.Event):
+    """Build a blocking call that returns once the gate is set."""
+    def wait() -> bool:
+        return gate.wait(timeout=5)
+    return wait
+
+
+@pytest.mark.asyncio
+async def test_identical_list_queries_share_one_computation(controller):
+    repo = SlowLeadRepository()
+    service = LeadService(repo, SingleFlight(), controller)
+
+    # Industry order differs between callers but the query is the same
+    industries = [["Finance", "Retail"], ["Retail", "Finance"]]
+    results = await asyncio.gather(*[
+        service.list_leads(industry=industries[i % 2]) for i in range(50)
+    ])
+
+    assert repo.calls == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_distinct_list_queries_are_computed_separately(controller):
+    repo = SlowLeadRepository(delay=0)
+    service = LeadService(repo, SingleFlight(), controller)
+
+    await asyncio.gather(
+        service.list_leads(min_headcount=1),
+        service.list_leads(min_headcount=2),
+    )
+
+    assert repo.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_max_pending_are_shed(controller):
+    gate = threading.Event()
+
+    tasks = [
+        asyncio.ensure_future(controller.run(blocking_until(gate)))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0.05)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert results[:2] == [True, True]
+    assert all(isinstance(r, ServiceOverloadedException) for r in results[2:])
+    assert results[2].retry_after == 7
+
+
+@pytest.mark.asyncio
+async def test_queued_call_past_latency_budget_is_dropped():
+    controller = AdmissionController(max_workers=1, latency_budget=0.1)
+    dropped_ran = threading.Event()
+
+    slow = controller.run(time.sleep, 0.3)
+    dropped = controller.run(dropped_ran.set)
+    results = await asyncio.gather(slow, dropped, return_exceptions=True)
+
+    assert results[0] is None
+    assert isinstance(results[1], ServiceOverloadedException)
+    assert not dropped_ran.is_set()
+    controller.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_over_budget_latency_sheds_while_workers_are_busy():
+    controller = AdmissionController(
+        max_workers=1, max_pending=10, latency_budget=0.02
+    )
+    # One 0.2s call pushes the moving average (alpha 0.2) to 0.04s
+    await controller.run(time.sleep, 0.2)
+    gate = threading.Event()
+    busy = asyncio.ensure_future(controller.run(blocking_until(gate)))
+    await asyncio.sleep(0.01)
+
+    # Rejected at admission, not after waiting in the queue
+    started = time.monotonic()
+    with pytest.raises(ServiceOverloadedException):
+        await controller.run(lambda: None)
+    assert time.monotonic() - started < 0.1
+
+    gate.set()
+    await busy
+    controller.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_admits_again_once_load_drains(controller):
+    gate = threading.Event()
+    held = [
+        asyncio.ensure_future(controller.run(blocking_until(gate)))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ServiceOverloadedException):
+        await controller.run(lambda: "shed")
+
+    gate.set()
+    await asyncio.gather(*held)
+
+    assert controller.pending() == 0
+    assert await controller.run(lambda: "admitted") == "admitted"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_calls_release_their_slots(controller):
+    gate = threading.Event()
+    busy = asyncio.ensure_future(controller.run(blocking_until(gate)))
+    await asyncio.sleep(0.05)
+    queued = asyncio.ensure_future(controller.run(lambda: "never"))
+    await asyncio.sleep(0.01)
+    assert controller.pending() == 2
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    gate.set()
+    await busy
+
+    assert controller.pending() == 0
+    results = await asyncio.gather(
+        controller.run(lambda: "a"), controller.run(lambda: "b")
+    )
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_timed_out_queued_calls_release_their_slots(controller):
+    gate = threading.Event()
+    busy = asyncio.ensure_future(controller.run(blocking_until(gate)))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(controller.run(lambda: "never"), timeout=0.05)
+    gate.set()
+    await busy
+
+    assert controller.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_sheds_with_retry_after(overload_client):
+    async with overload_client as client:
+        responses = await asyncio.gather(*[
+            client.get("/api/v1/leads", params={"min_headcount": i + 1})
+            for i in range(10)
+        ])
+
+    statuses = [response.status_code for response in responses]
+    assert statuses.count(200) == 2
+    assert statuses.count(503) == 8
+    shed = next(r for r in responses if r.status_code == 503)
+    assert shed.headers["Retry-After"] == "7"
+    assert shed.json()["detail"] == "Service is overloaded, please retry later"
+
+
+@pytest.fixture
+def cpu_bound_client():
+    """ASGI client over a realistic dataset with the default admission limits."""
+    templates = SeedDataGenerator().generate_leads(20)
+    repo = LeadRepository()
+    leads = []
+    for i in range(LOAD_TEST_LEADS):
+        template = templates[i % len(templates)]
+        leads.append(Lead(
+            name=template.name,
+            job_title=template.job_title,
+            company=template.company,
+            email=template.email,
+            industry=template.industry,
+            headcount=i % 1000 + 1,
+            created_at=BASE_TIME + timedelta(seconds=i * 7919 % LOAD_TEST_LEADS),
+        ))
+    asyncio.run(repo.bulk_create(leads))
+    controller = AdmissionController()
+    app.dependency_overrides[get_lead_repository] = lambda: repo
+    app.dependency_overrides[get_single_flight] = SingleFlight
+    app.dependency_overrides[get_admission_controller] = lambda: controller
+    yield repo, httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+    app.dependency_overrides.clear()
+    controller.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cheap_endpoints_do_not_wait_out_list_backlog(cpu_bound_client):
+    """
+    Local load test with CPU-bound list queries on 100k leads.
+
+    The worker pool runs threads, and the filter/sort holds the GIL, so
+    cheap endpoints still see tail latency from GIL hand-off. The pool
+    bounds that impact rather than removing it. Assert only that probes
+    stay fast at the median and never wait out the whole backlog, which
+    is what happens when the queries run inline on the event loop.
+    """
+    repo, client = cpu_bound_client
+    lead_id = next(iter(repo._storage))
+    started = time.monotonic()
+    repo.find_all_paginated_sync(min_headcount=1)
+    query_cost = time.monotonic() - started
+
+    async with client:
+        async def timed(url: str, **params) -> tuple[int, float]:
+            started = time.monotonic()
+            response = await client.get(url, params=params)
+            return response.status_code, time.monotonic() - started
+
+        list_calls = [
+            asyncio.ensure_future(timed("/api/v1/leads", min_headcount=i + 1))
+            for i in range(LOAD_TEST_QUERIES)
+        ]
+        await asyncio.sleep(0)
+        probes = []
+        for _ in range(10):
+            probes.append(await timed("/health"))
+            probes.append(await timed(f"/api/v1/leads/{lead_id}"))
+        list_results = await asyncio.gather(*list_calls)
+
+    latencies = sorted(elapsed for _, elapsed in probes)
+    inline_backlog = LOAD_TEST_QUERIES * query_cost
+    assert {status for status, _ in probes} == {200}
+    assert latencies[len(latencies) // 2] < 0.05
+    assert latencies[-1] < inline_backlog / 2
+    assert {status for status, _ in list_results} == {200, 503}
@@ -0,0 +1,258 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi.testclient import TestClient
+from app.api.v1.dependencies import get_lead_repository
+from app.core.exception import ValidationException
+from app.main import app
+from app.models.domain import Lead
+from app.repositories.lead_repository import LeadRepository
+from app.services.lead_service import LeadService
+from app.utils.pagination import create_change_cursor, encode_cursor
+
+BASE_TIME = datetime(2024, 1, 15, 10, 30)
+
+
+def make_lead(lead_id: str, minutes: int = 0) -> Lead:
+    """Build a lead last changed `minutes` after BASE_TIME."""
+    changed_at = BASE_TIME + timedelta(minutes=minutes)
+    return Lead(
+        id=lead_id,
+        name="John Doe",
+        job_title="CEO",
+        company="Acme Corp",
+        email="john.doe@acme.com",
+        industry="Technology",
+        created_at=changed_at,
+        updated_at=changed_at,
+    )
+
+
+def change_ids(page) -> list[str]:
+    return [change.lead_id for change in page.data]
+
+
+@pytest.fixture
+def repo() -> LeadRepository:
+    return LeadRepository()
+
+
+@pytest.fixture
+def client(repo):
+    app.dependency_overrides[get_lead_repository] = lambda: repo
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_changes_ordered_by_updated_at_then_id(repo):
+    await repo.create(make_lead("c", minutes=1))
+    await repo.bulk_create([make_lead("b", minutes=0), make_lead("a", minutes=0)])
+
+    page = await repo.find_changes_since()
+
+    assert change_ids(page) == ["a", "b", "c"]
+    assert page.total == 3
+
+
+@pytest.mark.asyncio
+async def test_update_moves_lead_to_end_of_index(repo):
+    lead_a = make_lead("a", minutes=0)
+    await repo.bulk_create([lead_a, make_lead("b", minutes=1)])
+
+    await repo.update(lead_a)
+
+    page = await repo.find_changes_since()
+    assert change_ids(page) == ["b", "a"]
+    assert page.data[-1].changed_at == lead_a.updated_at
+
+
+@pytest.mark.asyncio
+async def test_delete_leaves_tombstone(repo):
+    await repo.bulk_create([make_lead("a", minutes=0), make_lead("b", minutes=1)])
+
+    assert await repo.delete("a")
+
+    page = await repo.find_changes_since()
+    assert change_ids(page) == ["b", "a"]
+    tombstone = page.data[-1]
+    assert tombstone.deleted
+    assert tombstone.lead is None
+
+
+@pytest.mark.asyncio
+async def test_recreate_after_delete_replaces_tombstone(repo):
+    await repo.create(make_lead("a", minutes=0))
+    await repo.delete("a")
+
+    await repo.create(make_lead("a", minutes=5))
+
+    page = await repo.find_changes_since()
+    assert change_ids(page) == ["a"]
+    assert not page.data[0].deleted
+
+
+@pytest.mark.asyncio
+async def test_resume_from_cursor_after_further_changes(repo):
+    leads = [make_lead(f"lead-{i}", minutes=i) for i in range(5)]
+    await repo.bulk_create(leads)
+
+    first = await repo.find_changes_since(page_size=3)
+    second = await repo.find_changes_since(page_size=3, cursor=first.next_cursor)
+    assert change_ids(first) + change_ids(second) == [lead.id for lead in leads]
+    assert not second.has_next
+
+    await repo.update(leads[0])
+    await repo.delete("lead-3")
+    await repo.create(make_lead("lead-new", minutes=-60))
+
+    resumed = await repo.find_changes_since(cursor=second.next_cursor)
+
+    # The new lead's updated_at predates the watermark, so it is not seen
+    assert change_ids(resumed) == ["lead-0", "lead-3"]
+    assert resumed.total == 2
+    assert resumed.data[1].deleted
+
+
+@pytest.mark.asyncio
+async def test_updated_since_is_inclusive(repo):
+    await repo.bulk_create([make_lead(f"lead-{i}", minutes=i) for i in range(3)])
+
+    page = await repo.find_changes_since(
+        updated_since=BASE_TIME + timedelta(minutes=1)
+    )
+
+    assert change_ids(page) == ["lead-1", "lead-2"]
+    assert page.has_prev
+
+
+@pytest.mark.asyncio
+async def test_aware_updated_since_is_normalized_to_utc(repo):
+    await repo.bulk_create([make_lead(f"lead-{i}", minutes=i) for i in range(3)])
+    service = LeadService(repo)
+
+    # 12:31 at UTC+02:00 is 10:31 UTC
+    aware = datetime(2024, 1, 15, 12, 31, tzinfo=timezone(timedelta(hours=2)))
+    page = await service.list_changes(updated_since=aware)
+
+    assert change_ids(page) == ["lead-1", "lead-2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "updated_since, expected",
+    [
+        ("0001-01-01T00:00:00+05:00", ["lead-0", "lead-1"]),
+        ("9999-12-31T23:59:59-05:00", []),
+    ],
+)
+async def test_aware_updated_since_out_of_range_is_clamped(
+    repo, updated_since, expected
+):
+    await repo.bulk_create([make_lead(f"lead-{i}", minutes=i) for i in range(2)])
+    service = LeadService(repo)
+
+    page = await service.list_changes(
+        updated_since=datetime.fromisoformat(updated_since)
+    )
+
+    assert change_ids(page) == expected
+    assert page.next_cursor is not None
+
+
+def test_changes_endpoint_accepts_out_of_range_updated_since(client, repo):
+    asyncio.run(repo.create(make_lead("a", minutes=0)))
+
+    for updated_since in ["0001-01-01T00:00:00+05:00", "9999-12-31T23:59:59-05:00"]:
+        response = client.get(
+            "/api/v1/leads/changes", params={"updated_since": updated_since}
+        )
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_caught_up_cursor_is_echoed(repo):
+    await repo.bulk_create([make_lead("a", minutes=0), make_lead("b", minutes=1)])
+    last = await repo.find_changes_since()
+
+    caught_up = await repo.find_changes_since(cursor=last.next_cursor)
+
+    assert caught_up.data == []
+    assert caught_up.total == 0
+    assert caught_up.next_cursor == last.next_cursor
+
+    await repo.create(make_lead("c", minutes=2))
+    resumed = await repo.find_changes_since(cursor=caught_up.next_cursor)
+    assert change_ids(resumed) == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_caught_up_updated_since_returns_watermark_cursor(repo):
+    await repo.create(make_lead("a", minutes=0))
+    watermark = BASE_TIME + timedelta(minutes=10)
+
+    caught_up = await repo.find_changes_since(updated_since=watermark)
+
+    assert caught_up.data == []
+    assert caught_up.next_cursor == create_change_cursor(watermark.isoformat(), "")
+
+    await repo.create(make_lead("b", minutes=10))
+    resumed = await repo.find_changes_since(cursor=caught_up.next_cursor)
+    assert change_ids(resumed) == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_empty_feed_still_returns_cursor(repo):
+    page = await repo.find_changes_since()
+
+    assert page.data == []
+    assert page.next_cursor is not None
+
+    await repo.create(make_lead("a", minutes=0))
+    resumed = await repo.find_changes_since(cursor=page.next_cursor)
+    assert change_ids(resumed) == ["a"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!!",
+        encode_cursor([1]),
+        encode_cursor({"id": "a"}),
+        encode_cursor({"updated_at": "yesterday", "id": "a"}),
+        encode_cursor({"updated_at": "2024-01-15T10:30:00+00:00", "id": "a"}),
+    ],
+)
+async def test_malformed_cursor_raises_validation_error(repo, cursor):
+    await repo.create(make_lead("a", minutes=0))
+
+    with pytest.raises(ValidationException):
+        await repo.find_changes_since(cursor=cursor)
+
+
+def test_changes_endpoint_returns_tombstones(client, repo):
+    leads = [make_lead("a", minutes=0), make_lead("b", minutes=1)]
+    asyncio.run(repo.bulk_create(leads))
+    asyncio.run(repo.delete("a"))
+
+    response = client.get("/api/v1/leads/changes")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [change["id"] for change in body["data"]] == ["b", "a"]
+    assert body["data"][0]["lead"]["id"] == "b"
+    assert body["data"][1] == {
+        "id": "a",
+        "changed_at": body["data"][1]["changed_at"],
+        "deleted": True,
+        "lead": None,
+    }
+    assert body["pagination"]["next_cursor"] is not None
+
+
+def test_changes_endpoint_rejects_malformed_cursor(client):
+    response = client.get("/api/v1/leads/changes", params={"cursor": "WzFd"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+from app.core.exception import ServiceOverloadedException
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one shared computation."""
+    
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn for key, or join the call already in flight for key."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        
+        # Shield so one caller disconnecting does not cancel the others
+        return await asyncio.shield(task)
+    
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        return len(self._in_flight)
+
+
+class AdmissionController:
+    """Bounded worker pool that sheds load once it falls behind."""
+    
+    # Smoothing factor for the moving average of call latency
+    LATENCY_ALPHA = 0.2
+    
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 16,
+        latency_budget: float = 1.0,
+        retry_after: int = 1,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.latency_budget = latency_budget
+        self.retry_after = retry_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._avg_latency = 0.0
+        self._lock = threading.Lock()
+    
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking function in the worker pool.
+        
+        Raises ServiceOverloadedException when the queue is full, when
+        recent calls are over the latency budget and every worker is busy,
+        or when the call waited longer than the budget before starting.
+        """
+        with self._lock:
+            over_budget = (
+                self._pending >= self.max_workers
+                and self._avg_latency > self.latency_budget
+            )
+            if self._pending >= self.max_pending or over_budget:
+                raise ServiceOverloadedException(retry_after=self.retry_after)
+            self._pending += 1
+        
+        enqueued_at = time.monotonic()
+        
+        def _work() -> T:
+            # Drop work that already spent its budget waiting in the queue
+            if time.monotonic() - enqueued_at > self.latency_budget:
+                raise ServiceOverloadedException(retry_after=self.retry_after)
+            return fn(*args, **kwargs)
+        
+        def _release(future: Future) -> None:
+            # Also runs when queued work is cancelled and _work never starts
+            latency = time.monotonic() - enqueued_at
+            with self._lock:
+                self._pending -= 1
+                if not future.cancelled():
+                    self._avg_latency += self.LATENCY_ALPHA * (
+                        latency - self._avg_latency
+                    )
+        
+        try:
+            future = self._get_executor().submit(_work)
+        except RuntimeError:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(_release)
+        return await asyncio.wrap_future(future)
+    
+    def pending(self) -> int:
+        """Number of calls queued or running in the worker pool."""
+        return self._pending
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool - it is recreated on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="query-worker"
+            )
+        return self._executor
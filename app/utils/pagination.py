@@ -40,3 +40,11 @@ def create_cursor(last_item_created_at: str, last_item_id: str) -> str:
         "created_at": last_item_created_at,
         "id": last_item_id
     })
+
+
+def create_change_cursor(last_change_at: str, last_item_id: str) -> str:
+    """Create change feed cursor from last change timestamp and id."""
+    return encode_cursor({
+        "updated_at": last_change_at,
+        "id": last_item_id
+    })